@@ -2,25 +2,199 @@
 
 import sys
 import os
+import re
+import logging
+import functools
+from pathlib import Path
+from typing import Any
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QPushButton, QSlider, QComboBox,
-    QVBoxLayout, QHBoxLayout, QGroupBox, QGridLayout, QFrame, QSizePolicy, QTabWidget
+    QVBoxLayout, QHBoxLayout, QGroupBox, QGridLayout, QFrame, QSizePolicy, QTabWidget,
+    QButtonGroup
 )
-from PyQt6.QtCore import Qt, QSettings
-from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import Qt, QSettings, QTimer, pyqtSlot
 
-from src.native_backend import RogAuraBackendNative
-from src.ui_components import StatusBar, CompactColorPicker
+
+_ICON_PATH = 'assets/rog_icon.png' if os.path.isfile('assets/rog_icon.png') else None
+
+_MSG_SELECTED = "Selected color: {}".format
+_MSG_BRIGHT = "Brightness set to {}".format
+_MSG_APPLIED = "Applied {}".format
+_MSG_APPLIED_WITH = "Applied {effect} with {color}".format
+_MSG_APPLIED_SPEED = "Applied {effect} (speed {speed})".format
+_MSG_BREATHING = "Applied breathing with {color} (speed {speed})".format
+_MSG_FAILED = "Failed to apply {}".format
+_MSG_ACTIVE = "{} already active".format
+
+# (attribute, label, effect property, slot, grid position)
+_SINGLE_ZONE_BUTTONS = [
+    ("single_static_btn", "Static Color", "single_static", "_on_single_effect_button", None),
+    ("single_breathing_btn", "Breathing", None, "apply_single_breathing_with_selected_color", None),
+]
+
+_MULTI_ZONE_BUTTONS = [
+    ("multi_breathing_btn", "Multi Breathing", "multi_breathing", "_on_multi_effect_button", (0, 0)),
+    ("color_cycle_btn", "Color Cycle", "single_colorcycle", "_on_speed_effect_button", (0, 1)),
+    ("rainbow_btn", "Rainbow", None, "_on_rainbow_button", (1, 0)),
+    ("rainbow_cycle_btn", "Rainbow Cycle", "rainbow_cycle", "_on_speed_effect_button", (1, 1)),
+]
+
+_COLORS = [
+    ("Red", "#FF0000", "red"),
+    ("Green", "#00FF00", "green"),
+    ("Blue", "#0000FF", "blue"),
+    ("Yellow", "#FFFF00", "yellow"),
+    ("Gold", "#FFD700", "gold"),
+    ("Cyan", "#00FFFF", "cyan"),
+    ("Magenta", "#FF00FF", "magenta"),
+    ("White", "#FFFFFF", "white"),
+    ("Black", "#000000", "black")
+]
+
+_COLOR_BUTTON_TEMPLATE = """
+    QPushButton#colorButton {{
+        background-color: {hex};
+        color: {fg};
+        border: 2px solid #666;
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-weight: bold;
+        font-size: 12px;
+    }}
+    QPushButton#colorButton:hover {{
+        border-color: #888;
+        background-color: {hex}DD;
+    }}
+    QPushButton#colorButton:pressed {{
+        background-color: {hex}CC;
+    }}
+"""
+
+_LIGHT_BG = frozenset({"Yellow", "Gold", "White"})
+
+_COLOR_BUTTON_QSS = {
+    name: _COLOR_BUTTON_TEMPLATE.format(hex=hex_color, fg="black" if name in _LIGHT_BG else "white")
+    for name, hex_color, _ in _COLORS
+}
+
+
+def _mk_button(text, *, obj=None, min_h=None, qss=None):
+    btn = QPushButton(text)
+    if obj:
+        btn.setObjectName(obj)
+    if min_h:
+        btn.setMinimumHeight(min_h)
+    if qss:
+        btn.setStyleSheet(qss)
+    return btn
+
+
+_THEME_CACHE: dict[str, str] = {}
+
+
+def _theme_qss(theme: str) -> str:
+    qss = _THEME_CACHE.get(theme)
+    if qss is None:
+        try:
+            qss = Path(f'styles/{theme}_theme.qss').read_text()
+        except OSError:
+            # Cache the miss too so a missing theme is not reopened on every toggle
+            qss = ''
+        _THEME_CACHE[theme] = qss
+    return qss
+
+
+def _preload_themes():
+    for theme in _THEMES:
+        _theme_qss(theme)
+
+
+_THEMES = ('dark', 'light')
+
+_QSS_RULE = re.compile(r'([^{}]+)\{([^{}]*)\}')
+
+
+def _scope_qss(theme: str, qss: str) -> str:
+    scope = f'QMainWindow[theme="{theme}"]'
+    
+    def scope_rule(match):
+        selectors = []
+        for sel in match.group(1).split(','):
+            sel = sel.strip()
+            if sel.startswith('QMainWindow'):
+                sel = scope + sel[len('QMainWindow'):]
+            elif not sel.startswith('QToolTip'):
+                # Tooltips are top-level windows, never inside the main window
+                sel = f'{scope} {sel}'
+            selectors.append(sel)
+        return f"\n{', '.join(selectors)} {{{match.group(2)}}}"
+    
+    return _QSS_RULE.sub(scope_rule, qss)
+
+
+@functools.lru_cache(maxsize=1)
+def _merged_qss() -> str:
+    # Every theme in one sheet, each rule scoped to the main window's theme
+    # property, so dialogs keep the platform look and switching never reparses
+    return ''.join(_scope_qss(theme, _theme_qss(theme)) for theme in _THEMES)
+
+
+class CachedSettings:
+    def __init__(self, settings: QSettings):
+        self._settings = settings
+        # Read every stored key in one pass so later lookups never reach the backend
+        self._cache: dict[str, Any] = {k: settings.value(k) for k in settings.allKeys()}
+        self._dirty: set[str] = set()
+
+    def value(self, key: str, default=None, type=None):
+        if key not in self._cache:
+            return default
+        value = self._cache[key]
+        if type is not None and not isinstance(value, type):
+            # INI-backed settings come back as strings until coerced
+            if type is bool and isinstance(value, str):
+                value = value.lower() in ('true', '1')
+            else:
+                value = type(value)
+            self._cache[key] = value
+        return value
+
+    def setValue(self, key: str, value):
+        if key in self._cache and self._cache[key] == value:
+            return
+        self._cache[key] = value
+        self._dirty.add(key)
+
+    # The only place values reach QSettings; they are durable once the window
+    # has closed and called this
+    def sync(self):
+        if not self._dirty:
+            return
+        for key in self._dirty:
+            self._settings.setValue(key, self._cache[key])
+        self._dirty.clear()
+        self._settings.sync()
 
 
 class ROGAuraGUI(QMainWindow):
+    BRIGHTNESS_DEBOUNCE_MS = 80
+    
     def __init__(self):
         super().__init__()
-        self.settings = QSettings('ROGAura', 'GUI')
+        self.settings = CachedSettings(QSettings('ROGAura', 'GUI'))
+        self._current_qss = ''
+        from src.native_backend import RogAuraBackendNative
         self.backend = RogAuraBackendNative()
+        # Queued workers, the head one is running; they are started one at a
+        # time so HID transfers keep their click order
+        self._workers: list = []
+        self._single_effect_on_device = None
+        self.setUpdatesEnabled(False)
         self.init_ui()
         self.load_settings()
+        self.apply_theme()
+        self.setUpdatesEnabled(True)
         
     def init_ui(self):
         self.setWindowTitle("ROG Aura Core Control")
@@ -29,12 +203,12 @@ class ROGAuraGUI(QMainWindow):
         
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         
-        try:
-            self.setWindowIcon(QIcon('assets/rog_icon.png'))
-        except:
-            pass
+        if _ICON_PATH:
+            from PyQt6.QtGui import QIcon
+            self.setWindowIcon(QIcon(_ICON_PATH))
         
         central_widget = QWidget()
+        central_widget.setAttribute(Qt.WidgetAttribute.WA_DontCreateNativeAncestors)
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
         main_layout.setSpacing(15)
@@ -42,17 +216,23 @@ class ROGAuraGUI(QMainWindow):
         
         main_layout.setSizeConstraint(QVBoxLayout.SizeConstraint.SetMinimumSize)
         
+        self._pending_brightness = None
+        self._last_brightness = None
+        self._brightness_timer = QTimer(self)
+        self._brightness_timer.setSingleShot(True)
+        self._brightness_timer.setInterval(self.BRIGHTNESS_DEBOUNCE_MS)
+        self._brightness_timer.timeout.connect(self._flush_brightness)
+        
         self.create_title_section(main_layout)
 
         self.create_brightness_section(main_layout)
         
         self.create_tabbed_effects_section(main_layout)
         
+        from src.ui_components import StatusBar
         self.status_bar = StatusBar()
         main_layout.addWidget(self.status_bar)
         
-        self.apply_theme()
-        
     def create_title_section(self, parent_layout):
         title_frame = QFrame()
         title_frame.setObjectName("titleFrame")
@@ -84,6 +264,7 @@ class ROGAuraGUI(QMainWindow):
         self.brightness_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self.brightness_slider.setTickInterval(1)
         self.brightness_slider.valueChanged.connect(self.on_brightness_changed)
+        self.brightness_slider.sliderReleased.connect(self._flush_brightness)
         
         self.brightness_value = QLabel("2")
         self.brightness_value.setObjectName("valueLabel")
@@ -121,8 +302,7 @@ class ROGAuraGUI(QMainWindow):
         self.speed_combo.addItems(["1 (Slow)", "2 (Medium)", "3 (Fast)"])
         self.speed_combo.setCurrentIndex(1)
         
-        self.init_btn = QPushButton("Initialize Keyboard")
-        self.init_btn.setObjectName("initButton")
+        self.init_btn = _mk_button("Initialize Keyboard", obj="initButton")
         self.init_btn.clicked.connect(self.initialize_keyboard)
         
         control_layout.addWidget(speed_label)
@@ -143,6 +323,7 @@ class ROGAuraGUI(QMainWindow):
         row = QHBoxLayout()
         row.setSpacing(12)
 
+        from src.ui_components import CompactColorPicker
         self.compact_picker = CompactColorPicker()
         self.compact_picker.color_selected.connect(self._on_color_selected)
         row.addWidget(self.compact_picker, 2)  
@@ -153,14 +334,7 @@ class ROGAuraGUI(QMainWindow):
         act_label.setObjectName("miniSection")
         actions.addWidget(act_label)
 
-        self.single_static_btn = QPushButton("Static Color")
-        self.single_breathing_btn = QPushButton("Breathing")
-
-        self.single_static_btn.setMinimumHeight(36)
-        self.single_breathing_btn.setMinimumHeight(36)
-
-        actions.addWidget(self.single_static_btn)
-        actions.addWidget(self.single_breathing_btn)
+        self._mk_buttons(_SINGLE_ZONE_BUTTONS, actions, min_h=36)
         actions.addStretch()
 
         row.addLayout(actions, 1)
@@ -169,21 +343,29 @@ class ROGAuraGUI(QMainWindow):
 
         layout.addWidget(single_group)
         layout.addStretch()
+        
+    def _mk_buttons(self, specs, layout, min_h=None):
+        for attr, text, effect, slot, pos in specs:
+            btn = _mk_button(text, min_h=min_h)
+            if effect:
+                btn.setProperty('effect', effect)
+            btn.clicked.connect(getattr(self, slot))
+            if pos is None:
+                layout.addWidget(btn)
+            else:
+                layout.addWidget(btn, *pos)
+            setattr(self, attr, btn)
 
-        self.single_static_btn.clicked.connect(
-            lambda: self.apply_single_effect_with_selected_color("single_static")
-        )
-        self.single_breathing_btn.clicked.connect(self.apply_single_breathing_with_selected_color)
-
-    def _on_color_selected(self, hex_without_hash: str):
-        self.current_selected_color = hex_without_hash.lower()
-        self.current_selected_color_name = f"#{hex_without_hash.upper()}"
+    def _on_color_selected(self, hex_without_hash: str, color_name: str = None):
+        # Callers hand over uppercase hex: CompactColorPicker normalizes what
+        # it emits and the preset table is written that way
+        if getattr(self, 'current_selected_color', None) == hex_without_hash:
+            self.status_bar.show_message(_MSG_ACTIVE(self.current_selected_color_name))
+            return
+        self.current_selected_color = hex_without_hash
+        self.current_selected_color_name = color_name or f"#{hex_without_hash}"
 
-        success = self.backend.apply_custom_color(hex_without_hash)
-        if success:
-            self.status_bar.show_message(f"Selected color: #{hex_without_hash.upper()}")
-        else:
-            self.status_bar.show_error(f"Failed to apply color: #{hex_without_hash.upper()}")
+        self.status_bar.show_message(_MSG_SELECTED(self.current_selected_color_name))
 
     def create_multi_zone_tab(self, tab_widget):
         layout = QVBoxLayout(tab_widget)
@@ -193,68 +375,42 @@ class ROGAuraGUI(QMainWindow):
         multi_effects_layout = QVBoxLayout(multi_effects_group)
         
         effects_layout = QGridLayout()
-        
-        self.multi_breathing_btn = QPushButton("Multi Breathing")
-        self.color_cycle_btn = QPushButton("Color Cycle")
-        self.rainbow_btn = QPushButton("Rainbow")
-        self.rainbow_cycle_btn = QPushButton("Rainbow Cycle")
-        
-        effects_layout.addWidget(self.multi_breathing_btn, 0, 0)
-        effects_layout.addWidget(self.color_cycle_btn, 0, 1)
-        effects_layout.addWidget(self.rainbow_btn, 1, 0)
-        effects_layout.addWidget(self.rainbow_cycle_btn, 1, 1)
+        self._mk_buttons(_MULTI_ZONE_BUTTONS, effects_layout)
         
         multi_effects_layout.addLayout(effects_layout)
         layout.addWidget(multi_effects_group)
         
         layout.addStretch()
         
-        self.multi_breathing_btn.clicked.connect(lambda: self.apply_multi_effect("multi_breathing"))
-        self.color_cycle_btn.clicked.connect(lambda: self.apply_effect_with_speed("single_colorcycle"))
-        self.rainbow_btn.clicked.connect(lambda: self.backend.apply_rainbow())
-        self.rainbow_cycle_btn.clicked.connect(lambda: self.apply_effect_with_speed("rainbow_cycle"))
+    @pyqtSlot()
+    def _on_single_effect_button(self):
+        self.apply_single_effect_with_selected_color(self.sender().property('effect'))
         
-    def create_color_buttons(self, layout):
-        colors = [
-            ("Red", "#FF0000", "red"),
-            ("Green", "#00FF00", "green"),
-            ("Blue", "#0000FF", "blue"),
-            ("Yellow", "#FFFF00", "yellow"),
-            ("Gold", "#FFD700", "gold"),
-            ("Cyan", "#00FFFF", "cyan"),
-            ("Magenta", "#FF00FF", "magenta"),
-            ("White", "#FFFFFF", "white"),
-            ("Black", "#000000", "black")
-        ]
+    @pyqtSlot()
+    def _on_rainbow_button(self):
+        self._run_async("rainbow", self.backend.apply_rainbow, coalesce='lighting')
+        
+    @pyqtSlot()
+    def _on_multi_effect_button(self):
+        self.apply_multi_effect(self.sender().property('effect'))
+        
+    @pyqtSlot()
+    def _on_speed_effect_button(self):
+        self.apply_effect_with_speed(self.sender().property('effect'))
         
+    def create_color_buttons(self, layout):
         self.color_buttons = {}
-        self.current_selected_color = "ffffff"
+        self.current_selected_color = "FFFFFF"
         self.current_selected_color_name = "White"
+        self._color_group = QButtonGroup(self)
+        self._color_group.setExclusive(False)
+        self._colors_by_id = {}
         
         row, col = 0, 0
-        for name, hex_color, cmd in colors:
-            btn = QPushButton(name)
-            btn.setObjectName("colorButton")
-            btn.setMinimumHeight(40)
-            btn.setStyleSheet(f"""
-                QPushButton#colorButton {{
-                    background-color: {hex_color};
-                    color: {"white" if name == "Black" else "black" if name in ["Yellow", "Gold", "White"] else "white"};
-                    border: 2px solid #666;
-                    border-radius: 8px;
-                    padding: 8px 16px;
-                    font-weight: bold;
-                    font-size: 12px;
-                }}
-                QPushButton#colorButton:hover {{
-                    border-color: #888;
-                    background-color: {hex_color}DD;
-                }}
-                QPushButton#colorButton:pressed {{
-                    background-color: {hex_color}CC;
-                }}
-            """)
-            btn.clicked.connect(lambda checked, command=cmd, color_name=name, hex_val=hex_color[1:]: self.select_color(command, color_name, hex_val))
+        for i, (name, hex_color, cmd) in enumerate(_COLORS):
+            btn = _mk_button(name, obj="colorButton", min_h=40, qss=_COLOR_BUTTON_QSS[name])
+            self._color_group.addButton(btn, i)
+            self._colors_by_id[i] = (cmd, name, hex_color[1:])
             
             layout.addWidget(btn, row, col)
             self.color_buttons[name] = btn
@@ -263,89 +419,144 @@ class ROGAuraGUI(QMainWindow):
             if col > 4:
                 col = 0
                 row += 1
+        
+        self._color_group.idClicked.connect(self._on_color_id)
                 
+    @pyqtSlot(int)
+    def _on_color_id(self, button_id):
+        self.select_color(*self._colors_by_id[button_id])
+                
+    @pyqtSlot(int)
     def on_brightness_changed(self, value):
         self.brightness_value.setText(str(value))
-        self.backend.set_brightness(value)
-        self.status_bar.show_message(f"Brightness set to {value}")
+        self._pending_brightness = value
+        self._brightness_timer.start()
+        
+    @pyqtSlot()
+    def _flush_brightness(self):
+        self._brightness_timer.stop()
+        if self._pending_brightness is None:
+            return
+        value = self._pending_brightness
+        self._pending_brightness = None
+        if value == self._last_brightness:
+            return
+        
+        def on_done(ok):
+            if not ok and self._last_brightness == value:
+                self._last_brightness = None
+            self._report(ok, _MSG_BRIGHT(value), _MSG_FAILED(f"brightness {value}"))
+        
+        self._run_async(
+            f"brightness {value}", lambda: self.backend.set_brightness(value),
+            on_done=on_done, coalesce='brightness'
+        )
+        self._last_brightness = value
         
     def select_color(self, command, color_name, hex_color):
-        self.current_selected_color = hex_color
-        self.current_selected_color_name = color_name
-        self.selected_color_display.setText(color_name)
-        
-        success = self.backend.apply_color(command)
-        if success:
-            self.status_bar.show_message(f"Selected color: {color_name}")
-        else:
-            self.status_bar.show_error(f"Failed to apply color: {command}")
+        self._on_color_selected(hex_color, color_name)
             
     def apply_single_effect_with_selected_color(self, effect_name):
-        success = self.backend.apply_single_effect(effect_name, self.current_selected_color)
-        if success:
-            self.status_bar.show_message(f"Applied {effect_name} with {self.current_selected_color_name}")
-        else:
-            self.status_bar.show_error(f"Failed to apply {effect_name}")
+        message = _MSG_APPLIED_WITH(effect=effect_name, color=self.current_selected_color_name)
+        state = (effect_name, self.current_selected_color)
+        if self._single_effect_on_device == state:
+            self.status_bar.show_message(message)
+            return
+        
+        def on_done(ok):
+            if not ok and self._single_effect_on_device == state:
+                self._single_effect_on_device = None
+            self._report(ok, message, _MSG_FAILED(effect_name))
+        
+        self._run_async(
+            effect_name, lambda: self.backend.apply_single_effect(*state),
+            on_done=on_done, coalesce='lighting'
+        )
+        self._single_effect_on_device = state
             
+    @pyqtSlot()
     def apply_single_breathing_with_selected_color(self):
         speed = self.speed_combo.currentIndex() + 1
-        success = self.backend.apply_speed_effect_with_colors("single_breathing", self.current_selected_color, "000000", speed)
-        if success:
-            self.status_bar.show_message(f"Applied breathing with {self.current_selected_color_name} (speed {speed})")
-        else:
-            self.status_bar.show_error("Failed to apply breathing effect")
+        message = _MSG_BREATHING(color=self.current_selected_color_name, speed=speed)
+        color = self.current_selected_color
+        self._run_async(
+            "single_breathing",
+            lambda: self.backend.apply_speed_effect_with_colors("single_breathing", color, "000000", speed),
+            on_done=lambda ok: self._report(ok, message, "Failed to apply breathing effect"),
+            coalesce='lighting'
+        )
             
     def apply_effect_with_speed(self, effect_name):
         speed = self.speed_combo.currentIndex() + 1
-        success = self.backend.apply_speed_effect(effect_name, speed)
-        if success:
-            self.status_bar.show_message(f"Applied {effect_name} (speed {speed})")
-        else:
-            self.status_bar.show_error(f"Failed to apply {effect_name}")
+        self._run_async(
+            effect_name, lambda: self.backend.apply_speed_effect(effect_name, speed),
+            on_done=lambda ok: self._report(ok, _MSG_APPLIED_SPEED(effect=effect_name, speed=speed), _MSG_FAILED(effect_name)),
+            coalesce='lighting'
+        )
             
     def apply_multi_effect(self, effect_name):
         speed = self.speed_combo.currentIndex() + 1 if "breathing" in effect_name else None
-        success = self.backend.apply_multi_zone_effect(effect_name, speed)
-        if success:
-            self.status_bar.show_message(f"Applied {effect_name}")
-        else:
-            self.status_bar.show_error(f"Failed to apply {effect_name}")
+        self._run_async(
+            effect_name, lambda: self.backend.apply_multi_zone_effect(effect_name, speed),
+            on_done=lambda ok: self._report(ok, _MSG_APPLIED(effect_name), _MSG_FAILED(effect_name)),
+            coalesce='lighting'
+        )
         
-    def open_color_picker(self):
-        color = QColorDialog.getColor()
-        if color.isValid():
-            hex_color = color.name()[1:]
-            custom_name = f"Custom #{hex_color.upper()}"
-            
-            self.current_selected_color = hex_color
-            self.current_selected_color_name = custom_name
-            self.selected_color_display.setText(custom_name)
+    @pyqtSlot()
+    def initialize_keyboard(self):
+        self._run_async(
+            "initialize keyboard", self.backend.initialize_keyboard,
+            on_done=lambda ok: self._report(ok, "Keyboard initialized successfully", "Failed to initialize keyboard")
+        )
+        
+    def _run_async(self, name, func, on_done=None, coalesce=None):
+        from src.native_backend import NativeCommandThread
+        self._single_effect_on_device = None
+        # A command still waiting behind the running one is superseded by a
+        # newer command of the same kind, only the final state reaches the device
+        if (coalesce is not None and len(self._workers) > 1
+                and self._workers[-1].coalesce_key == coalesce):
+            self._workers.pop()
+        worker = NativeCommandThread(self.backend, name, func)
+        worker.coalesce_key = coalesce
+        if on_done is not None:
+            worker.command_finished.connect(lambda ok, message: on_done(ok))
+        else:
+            worker.command_finished.connect(self._on_command_finished)
+        worker.finished.connect(self._start_next_worker)
+        self._workers.append(worker)
+        if len(self._workers) == 1:
+            worker.start()
             
-            self.color_picker_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {color.name()};
-                    color: {'black' if color.lightness() > 128 else 'white'};
-                    border: 2px solid #666;
-                    border-radius: 8px;
-                    padding: 8px 16px;
-                    font-weight: bold;
-                }}
-            """)
-            self.color_picker_btn.setText(f"Custom: {hex_color.upper()}")
+    @pyqtSlot()
+    def _start_next_worker(self):
+        worker = self.sender()
+        if worker in self._workers:
+            self._workers.remove(worker)
+        if self._workers and not self._workers[0].isRunning():
+            self._workers[0].start()
             
-            success = self.backend.apply_custom_color(hex_color)
-            if success:
-                self.status_bar.show_message(f"Selected custom color: #{hex_color}")
-            else:
-                self.status_bar.show_error("Failed to apply custom color")
-                
-    def initialize_keyboard(self):
-        success = self.backend.initialize_keyboard()
+    def _wait_for_workers(self):
+        for worker in list(self._workers):
+            if not worker.isRunning() and not worker.isFinished():
+                worker.start()
+            worker.wait()
+        self._workers.clear()
+        
+    @pyqtSlot(bool, str)
+    def _on_command_finished(self, success, message):
+        if success:
+            self.status_bar.show_message(message)
+        else:
+            self.status_bar.show_error(message)
+        
+    def _report(self, success, message, error):
         if success:
-            self.status_bar.show_message("Keyboard initialized successfully")
+            self.status_bar.show_message(message)
         else:
-            self.status_bar.show_error("Failed to initialize keyboard")
+            self.status_bar.show_error(error)
             
+    @pyqtSlot()
     def toggle_theme(self):
         current_theme = self.settings.value('theme', 'light')
         new_theme = 'dark' if current_theme == 'light' else 'light'
@@ -354,31 +565,61 @@ class ROGAuraGUI(QMainWindow):
         
     def apply_theme(self):
         self.load_dark_theme()
+        self._set_qss(_merged_qss())
             
     def load_dark_theme(self):
-        with open('styles/dark_theme.qss', 'r') as f:
-            self.setStyleSheet(f.read())
+        self._set_theme_property('dark')
             
     def load_light_theme(self):
-        with open('styles/light_theme.qss', 'r') as f:
-            self.setStyleSheet(f.read())
+        self._set_theme_property('light')
+        
+    def _set_qss(self, qss: str):
+        if qss != self._current_qss:
+            QApplication.instance().setStyleSheet(qss)
+            self._current_qss = qss
+            
+    def _set_theme_property(self, theme: str):
+        if self.property('theme') == theme:
+            return
+        self.setProperty('theme', theme)
+        if self._current_qss:
+            # Theme rules match on this ancestor property, so the window and its
+            # children are re-polished against the already parsed sheet
+            style = self.style()
+            for widget in (self, *self.findChildren(QWidget)):
+                style.unpolish(widget)
+                style.polish(widget)
             
     def load_settings(self):
         brightness = self.settings.value('brightness', 2, type=int)
         self.brightness_slider.setValue(brightness)
         
     def save_settings(self):
-        self.settings.setValue('brightness', self.brightness_slider.value())
+        staged = {
+            'brightness': self.brightness_slider.value(),
+        }
+        for key, value in staged.items():
+            self.settings.setValue(key, value)
         
     def closeEvent(self, event):
+        self._flush_brightness()
+        self._wait_for_workers()
+        self.backend.disconnect()
         self.save_settings()
+        self.settings.sync()
         event.accept()
 
 
 def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     app = QApplication(sys.argv)
     app.setApplicationName("ROG Aura Core GUI")
     app.setOrganizationName("ROGAura")
+    _preload_themes()
     
     app.setStyle('Fusion')
     
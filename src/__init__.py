@@ -1,18 +1,39 @@
-from .native_backend import RogAuraBackendNative, NativeCommandThread
-from .native_rgb import RogAuraNative, RogAuraUSB, Color, Speed
-from .ui_components import ColorPicker, EffectSelector, StatusBar, AnimatedButton, ColorWheel, LogViewer
+import importlib
+
+_LAZY = {
+    'RogAuraBackendNative': '.native_backend',
+    'NativeCommandThread': '.native_backend',
+    'RogAuraNative': '.native_rgb',
+    'RogAuraUSB': '.native_rgb',
+    'Color': '.native_rgb',
+    'Speed': '.native_rgb',
+    'ColorPicker': '.ui_components',
+    'EffectSelector': '.ui_components',
+    'StatusBar': '.ui_components',
+    'AnimatedButton': '.ui_components',
+    'ColorWheel': '.ui_components',
+    'LogViewer': '.ui_components'
+}
 
 __all__ = [
     'RogAuraBackendNative',
-    'NativeCommandThread', 
+    'NativeCommandThread',
     'RogAuraNative',
     'RogAuraUSB',
     'Color',
     'Speed',
-    'ColorPicker', 
-    'EffectSelector', 
-    'StatusBar', 
-    'AnimatedButton', 
-    'ColorWheel', 
+    'ColorPicker',
+    'EffectSelector',
+    'StatusBar',
+    'AnimatedButton',
+    'ColorWheel',
     'LogViewer'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
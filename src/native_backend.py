@@ -1,76 +1,166 @@
 import logging
+import re
+import threading
+from operator import methodcaller
 from typing import Optional, List
 from PyQt6.QtCore import QObject, pyqtSignal, QThread
 from .native_rgb import RogAuraNative
 
 
+_HEX6 = re.compile(r'^#?([0-9a-fA-F]{6})$')
+
+_VALID_COLORS = frozenset({
+    'red', 'green', 'blue', 'yellow', 'gold',
+    'cyan', 'magenta', 'white', 'black'
+})
+
+_RAINBOW = methodcaller('rainbow')
+_INITIALIZE_KEYBOARD = methodcaller('initialize_keyboard')
+
+# effect name -> (label format, RogAuraNative method)
+_SINGLE_EFFECTS = {
+    'single_static': ('Apply single effect: single_static with color %s', 'single_static'),
+}
+
+_COLOR_SPEED_EFFECTS = {
+    'single_breathing': ('Apply speed effect with colors: single_breathing (speed %d)', 'single_breathing'),
+}
+
+_SPEED_EFFECTS = {
+    'single_colorcycle': ('Apply speed effect: single_colorcycle (speed %d)', 'single_colorcycle'),
+    'rainbow_cycle': ('Apply speed effect: rainbow_cycle (speed %d)', 'rainbow_cycle'),
+    'single_breathing': ('Apply speed effect: single_breathing (speed %d)', 'single_breathing'),
+}
+
+# effect name -> (label format, RogAuraNative method, takes speed)
+_MULTI_ZONE_EFFECTS = {
+    'multi_static': ('Multi-zone static', 'multi_static', False),
+    'multi_breathing': ('Multi-zone breathing (speed %d)', 'multi_breathing', True),
+}
+
+
 class RogAuraBackendNative(QObject):    
     command_executed = pyqtSignal(str, bool)
     error_occurred = pyqtSignal(str)
     
+    # Release the interface after this many idle seconds so the kernel
+    # keyboard driver gets reattached between bursts of commands
+    IDLE_DISCONNECT_SECONDS = 2.0
+    
     def __init__(self):
         super().__init__()
-        self.setup_logging()
+        self.logger = logging.getLogger(__name__)
         self.aura = RogAuraNative()
         self.connected = False
+        self._lock = threading.RLock()
+        self._idle_timer = None
+        # Bumped whenever the pending idle disconnect is cancelled or replaced
+        self._idle_generation = 0
         
-    def setup_logging(self):
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        self.logger = logging.getLogger(__name__)
-    
     def connect(self) -> bool:
-        if self.connected:
-            return True
-            
-        try:
-            self.connected = self.aura.connect()
+        with self._lock:
             if self.connected:
-                self.logger.info("Connected to ROG keyboard via USB")
-                self.command_executed.emit("USB Connection", True)
-            else:
-                self.logger.error("Failed to connect to ROG keyboard")
-                self.error_occurred.emit("Failed to connect to keyboard. Check USB connection and permissions.")
-            return self.connected
-        except Exception as e:
-            error_msg = f"Connection error: {str(e)}"
-            self.logger.error(error_msg)
-            self.error_occurred.emit(error_msg)
-            return False
+                return True
+                
+            try:
+                self.connected = self.aura.connect()
+                if self.connected:
+                    self.logger.info("Connected to ROG keyboard via USB")
+                    self.command_executed.emit("USB Connection", True)
+                    # An explicit connect is released when idle like any other
+                    self._schedule_idle_disconnect()
+                else:
+                    self.logger.error("Failed to connect to ROG keyboard")
+                    self.error_occurred.emit("Failed to connect to keyboard. Check USB connection and permissions.")
+                return self.connected
+            except Exception as e:
+                error_msg = f"Connection error: {str(e)}"
+                self.logger.error(error_msg)
+                self.error_occurred.emit(error_msg)
+                return False
     
     def disconnect(self):
+        with self._lock:
+            self._cancel_idle_disconnect()
+            if self.connected:
+                self.aura.disconnect()
+                self.connected = False
+                self.logger.info("Disconnected from keyboard")
+    
+    def _ensure_connected(self) -> bool:
+        if not self.connected:
+            self.connected = self.aura.connect()
+        return self.connected
+    
+    def _drop_connection(self):
+        self.aura.disconnect()
+        self.connected = False
+    
+    def _cancel_idle_disconnect(self):
+        self._idle_generation += 1
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+    
+    def _schedule_idle_disconnect(self):
+        self._cancel_idle_disconnect()
         if self.connected:
-            self.aura.disconnect()
-            self.connected = False
-            self.logger.info("Disconnected from keyboard")
+            self._idle_timer = threading.Timer(
+                self.IDLE_DISCONNECT_SECONDS, self._idle_disconnect, (self._idle_generation,)
+            )
+            self._idle_timer.daemon = True
+            self._idle_timer.start()
+    
+    def _idle_disconnect(self, generation: int):
+        with self._lock:
+            # cancel() is a no-op once the timer has fired and is waiting on
+            # the lock, so a command that ran meanwhile leaves a stale generation
+            if generation != self._idle_generation:
+                return
+            self.disconnect()
     
     def _execute_with_connection(self, operation_name: str, operation_func) -> bool:
-        temp_aura = RogAuraNative()
-        
+        with self._lock:
+            self._cancel_idle_disconnect()
+            try:
+                return self._run_operation(operation_name, operation_func)
+            finally:
+                self._schedule_idle_disconnect()
+    
+    def _run_operation(self, operation_name: str, operation_func) -> bool:
         try:
-            if not temp_aura.connect():
+            if not self._ensure_connected():
                 self.logger.error(f"Failed to connect for operation: {operation_name}")
                 self.command_executed.emit(operation_name, False)
                 return False
             
-            success = operation_func(temp_aura)
+            try:
+                success = operation_func(self.aura)
+            except Exception:
+                self.logger.warning(f"Reconnecting after error in: {operation_name}")
+                self._drop_connection()
+                if not self._ensure_connected():
+                    raise
+                success = operation_func(self.aura)
+            
             if success:
                 self.logger.info(f"Successfully executed: {operation_name}")
                 self.command_executed.emit(operation_name, True)
             else:
                 self.logger.error(f"Failed to execute: {operation_name}")
                 self.command_executed.emit(operation_name, False)
+                # Only a failed transfer means the handle may have gone stale;
+                # a rejected argument leaves the interface claimed
+                if self.aura.transfer_failed:
+                    self._drop_connection()
             return success
             
         except Exception as e:
             error_msg = f"Error executing {operation_name}: {str(e)}"
             self.logger.error(error_msg)
             self.error_occurred.emit(error_msg)
+            self._drop_connection()
             return False
-        finally:
-            temp_aura.disconnect()
     
     def set_brightness(self, brightness: int) -> bool:
         if not 0 <= brightness <= 3:
@@ -79,98 +169,72 @@ class RogAuraBackendNative(QObject):
         
         return self._execute_with_connection(
             f"Set brightness to {brightness}",
-            lambda aura: aura.set_brightness(brightness)
+            methodcaller('set_brightness', brightness)
         )
     
     def apply_color(self, color: str) -> bool:
-        valid_colors = [
-            'red', 'green', 'blue', 'yellow', 'gold', 
-            'cyan', 'magenta', 'white', 'black'
-        ]
-        
-        if color.lower() not in valid_colors:
+        c = color.lower()
+        if c not in _VALID_COLORS:
             self.logger.error(f"Invalid color: {color}")
             return False
         
         return self._execute_with_connection(
             f"Apply color: {color}",
-            lambda aura: aura.apply_color(color.lower())
+            methodcaller('apply_color', c)
         )
     
     def apply_custom_color(self, hex_color: str) -> bool:
-        try:
-            if hex_color.startswith('#'):
-                hex_color = hex_color[1:]
-            int(hex_color, 16)
-            if len(hex_color) != 6:
-                raise ValueError("Invalid hex color length")
-        except ValueError:
+        m = _HEX6.match(hex_color)
+        if not m:
             self.logger.error(f"Invalid hex color: {hex_color}")
             return False
+        hex_color = m.group(1)
         
         return self._execute_with_connection(
             f"Apply custom color: #{hex_color}",
-            lambda aura: aura.apply_custom_color(hex_color)
+            methodcaller('apply_custom_color', hex_color)
         )
     
-    def apply_single_effect(self, effect, color):
-        def operation(conn):
-            if effect == "single_static":
-                return conn.single_static(color_hex=color)
-            else:
-                return False
+    def _dispatch_effect(self, table, effect, label_args, **kwargs) -> bool:
+        spec = table.get(effect)
+        if spec is None:
+            self.logger.error(f"Unknown effect: {effect}")
+            return False
         
-        return self._execute_with_connection(f"Apply single effect: {effect} with color {color}", operation)
+        label, method = spec[0], spec[1]
+        return self._execute_with_connection(label % label_args, methodcaller(method, **kwargs))
+    
+    def apply_single_effect(self, effect, color):
+        return self._dispatch_effect(_SINGLE_EFFECTS, effect, color, color_hex=color)
     
     def apply_speed_effect(self, effect, speed):
-        def operation(conn):
-            if effect == "single_colorcycle":
-                return conn.single_colorcycle(speed=speed)
-            elif effect == "rainbow_cycle":
-                return conn.rainbow_cycle(speed=speed)
-            elif effect == "single_breathing":
-                return conn.single_breathing(speed=speed)
-            else:
-                return False
-        
-        return self._execute_with_connection(f"Apply speed effect: {effect} (speed {speed})", operation)
+        return self._dispatch_effect(_SPEED_EFFECTS, effect, speed, speed=speed)
     
     def apply_speed_effect_with_colors(self, effect, color1, color2, speed):
-        def operation(conn):
-            if effect == "single_breathing":
-                return conn.single_breathing(color1_hex=color1, color2_hex=color2, speed=speed)
-            else:
-                return False
-        
-        return self._execute_with_connection(f"Apply speed effect with colors: {effect} (speed {speed})", operation)
+        return self._dispatch_effect(
+            _COLOR_SPEED_EFFECTS, effect, speed,
+            color1_hex=color1, color2_hex=color2, speed=speed
+        )
     
     def apply_multi_zone_effect(self, effect_name: str, speed: int = None) -> bool:
-        if effect_name == "multi_static":
-            return self._execute_with_connection(
-                "Multi-zone static",
-                lambda aura: aura.multi_static()
-            )
-        elif effect_name == "multi_breathing":
-            if not speed or not 1 <= speed <= 3:
-                speed = 2
-            return self._execute_with_connection(
-                f"Multi-zone breathing (speed {speed})",
-                lambda aura: aura.multi_breathing(speed=speed)
-            )
-        else:
-            self.logger.error(f"Unknown multi-zone effect: {effect_name}")
-            return False
+        spec = _MULTI_ZONE_EFFECTS.get(effect_name)
+        if spec is None or not spec[2]:
+            return self._dispatch_effect(_MULTI_ZONE_EFFECTS, effect_name, ())
+        
+        if not speed or not 1 <= speed <= 3:
+            speed = 2
+        return self._dispatch_effect(_MULTI_ZONE_EFFECTS, effect_name, speed, speed=speed)
     
     def apply_rainbow(self) -> bool:
         return self._execute_with_connection(
             "Rainbow effect",
-            lambda aura: aura.rainbow()
+            _RAINBOW
         )
     
     def initialize_keyboard(self) -> bool:
         return self._execute_with_connection(
             "Initialize keyboard",
-            lambda aura: aura.initialize_keyboard()
+            _INITIALIZE_KEYBOARD
         )
     
     def test_connection(self) -> bool:
@@ -1,16 +1,37 @@
 import usb.core
 import usb.util
 import array
+import functools
 import logging
 from typing import Optional, List, Tuple
 from enum import Enum
 
 
 class Color:
+    # Immutable, since from_hex and COLORS hand the same instance to every caller
+    __slots__ = ('red', 'green', 'blue')
+    
     def __init__(self, red: int, green: int, blue: int):
-        self.red = max(0, min(255, red))
-        self.green = max(0, min(255, green))
-        self.blue = max(0, min(255, blue))
+        _set = object.__setattr__
+        _set(self, 'red', red if 0 <= red <= 255 else (0 if red < 0 else 255))
+        _set(self, 'green', green if 0 <= green <= 255 else (0 if green < 0 else 255))
+        _set(self, 'blue', blue if 0 <= blue <= 255 else (0 if blue < 0 else 255))
+    
+    @classmethod
+    def _unchecked(cls, red: int, green: int, blue: int):
+        # For components already known to be bytes, skips the clamping
+        color = cls.__new__(cls)
+        _set = object.__setattr__
+        _set(color, 'red', red)
+        _set(color, 'green', green)
+        _set(color, 'blue', blue)
+        return color
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
     
     @classmethod
     def from_hex(cls, hex_color: str):
@@ -20,15 +41,24 @@ class Color:
         if len(hex_color) != 6:
             raise ValueError("Hex color must be 6 characters")
             
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        return cls(r, g, b)
+        return _parse_hex(hex_color)
     
     def to_tuple(self) -> Tuple[int, int, int]:
         return (self.red, self.green, self.blue)
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_hex(hex_color: str) -> Color:
+    # bytes.fromhex rejects the '0x'/'_' forms int(..., 16) would accept
+    rgb = bytes.fromhex(hex_color)
+    if len(rgb) != 3:
+        raise ValueError("Hex color must be 6 characters")
+    return Color._unchecked(rgb[0], rgb[1], rgb[2])
+
+
+_SPEED_BYTES = (0xe1, 0xeb, 0xf5)
+
+
 class Speed(Enum):
     SLOW = 1
     MEDIUM = 2
@@ -36,7 +66,7 @@ class Speed(Enum):
     
     @property
     def byte_value(self) -> int:
-        return [0xe1, 0xeb, 0xf5][self.value - 1]
+        return _SPEED_BYTES[self.value - 1]
 
 
 class RogAuraUSB:
@@ -45,29 +75,72 @@ class RogAuraUSB:
     
     MESSAGE_LENGTH = 17
     
-    MESSAGE_SET = array.array('B', [0x5d, 0xb5] + [0] * 15)
-    MESSAGE_APPLY = array.array('B', [0x5d, 0xb4] + [0] * 15)
-    MESSAGE_BRIGHTNESS = array.array('B', [0x5a, 0xba, 0xc5, 0xc4] + [0] * 13)
-    MESSAGE_INITIALIZE = array.array('B', [0x5a, 0x41, 0x53, 0x55, 0x53, 0x20, 0x54, 0x65, 0x63, 0x68, 0x2e, 0x49, 0x6e, 0x63, 0x2e, 0x00, 0x00])
+    MESSAGE_SET = bytes([0x5d, 0xb5] + [0] * 15)
+    MESSAGE_APPLY = bytes([0x5d, 0xb4] + [0] * 15)
+    MESSAGE_BRIGHTNESS = bytes([0x5a, 0xba, 0xc5, 0xc4] + [0] * 13)
+    MESSAGE_INITIALIZE = bytes([0x5a, 0x41, 0x53, 0x55, 0x53, 0x20, 0x54, 0x65, 0x63, 0x68, 0x2e, 0x49, 0x6e, 0x63, 0x2e, 0x00, 0x00])
     
     COLORS = {
-        'red': Color(255, 0, 0),
-        'green': Color(0, 255, 0),
-        'blue': Color(0, 0, 255),
-        'yellow': Color(255, 255, 0),
-        'gold': Color(255, 140, 0),
-        'cyan': Color(0, 255, 255),
-        'magenta': Color(255, 0, 255),
-        'white': Color(255, 255, 255),
-        'black': Color(0, 0, 0),
+        'red': Color._unchecked(255, 0, 0),
+        'green': Color._unchecked(0, 255, 0),
+        'blue': Color._unchecked(0, 0, 255),
+        'yellow': Color._unchecked(255, 255, 0),
+        'gold': Color._unchecked(255, 140, 0),
+        'cyan': Color._unchecked(0, 255, 255),
+        'magenta': Color._unchecked(255, 0, 255),
+        'white': Color._unchecked(255, 255, 255),
+        'black': Color._unchecked(0, 0, 0),
     }
     
     def __init__(self):
         self.device = None
         self.interface = None
         self.logger = logging.getLogger(__name__)
+        # Set when a control transfer errors or comes up short, as opposed to
+        # a command rejected before anything was sent; cleared on connect
+        self.transfer_failed = False
+        self._last_frame = None
+        self._build_templates()
+    
+    def _build_templates(self):
+        # One preallocated buffer per message kind; each command only rewrites
+        # its color/speed bytes. Reuse is safe because transfers are synchronous.
+        # They stay array('B') since pyusb sends those without copying, while
+        # the class-level MESSAGE_* constants are immutable bytes.
+        self._tpl_brightness = array.array('B', self.MESSAGE_BRIGHTNESS)
+        self._msg_set = array.array('B', self.MESSAGE_SET)
+        self._msg_apply = array.array('B', self.MESSAGE_APPLY)
+        self._msg_initialize = array.array('B', self.MESSAGE_INITIALIZE)
+        
+        self._tpl_static = self._create_message()
+        
+        self._tpl_breathing = self._create_message()
+        self._tpl_breathing[3] = 1
+        self._tpl_breathing[9] = 1
+        
+        self._tpl_colorcycle = self._create_message()
+        self._tpl_colorcycle[3] = 2
+        self._tpl_colorcycle[4] = 0xff
+        
+        self._tpl_rainbow_cycle = self._create_message()
+        self._tpl_rainbow_cycle[3] = 3
+        self._tpl_rainbow_cycle[4] = 0xff
+        
+        self._tpl_multi_static = []
+        self._tpl_multi_breathing = []
+        for zone in range(1, 5):
+            msg = self._create_message()
+            msg[2] = zone
+            msg[7] = 0xeb
+            self._tpl_multi_static.append(msg)
+            
+            msg = self._create_message()
+            msg[2] = zone
+            msg[3] = 1
+            self._tpl_multi_breathing.append(msg)
         
     def connect(self) -> bool:
+        self.transfer_failed = False
         try:
             self.device = None
             for product_id in self.SUPPORTED_PRODUCT_IDS:
@@ -106,6 +179,7 @@ class RogAuraUSB:
             return False
     
     def disconnect(self):
+        self._last_frame = None
         if self.device and self.interface:
             try:
                 usb.util.release_interface(self.device, self.interface)
@@ -132,131 +206,114 @@ class RogAuraUSB:
         return msg
     
     def _send_message(self, message: array.array) -> bool:
-        try:
-            if not self.device:
-                return False
-                
-            result = self.device.ctrl_transfer(
-                bmRequestType=0x21,
-                bRequest=0x09,
-                wValue=0x035d,
-                wIndex=0,
-                data_or_wLength=message,
-                timeout=1000
-            )
-            return result == len(message)
-            
-        except Exception as e:
-            self.logger.error(f"Failed to send message: {e}")
-            return False
+        return self._send_messages([message], set_and_apply=False)
     
     def _send_messages(self, messages: List[array.array], set_and_apply: bool = True) -> bool:
+        # The 0x5d feature report is fixed at MESSAGE_LENGTH bytes, so a frame
+        # cannot be packed into one transfer; send it in a single tight pass
+        # with one device lookup and error path instead
+        if not self.device:
+            return False
+        
+        # Skip the transfers entirely when the keyboard already shows this frame
+        key = (set_and_apply, b''.join(bytes(m) for m in messages))
+        if key == self._last_frame:
+            return True
+        self._last_frame = None
+        
+        frame = list(messages)
+        if set_and_apply:
+            frame.append(self._msg_set)
+            frame.append(self._msg_apply)
+        
+        transfer = self.device.ctrl_transfer
         try:
-            for msg in messages:
-                if not self._send_message(msg):
-                    return False
-            
-            if set_and_apply:
-                if not self._send_message(self.MESSAGE_SET):
+            for msg in frame:
+                if transfer(0x21, 0x09, 0x035d, 0, msg, 1000) != len(msg):
+                    self.transfer_failed = True
                     return False
-                if not self._send_message(self.MESSAGE_APPLY):
-                    return False
-            
+            self._last_frame = key
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to send messages: {e}")
+            self.transfer_failed = True
             return False
     
     def set_brightness(self, brightness: int) -> bool:
         if not 0 <= brightness <= 3:
             return False
             
-        msg = array.array('B', self.MESSAGE_BRIGHTNESS)
+        msg = self._tpl_brightness
         msg[4] = brightness
         return self._send_messages([msg], set_and_apply=False)
     
     def initialize_keyboard(self) -> bool:
-        msg = array.array('B', self.MESSAGE_INITIALIZE)
-        return self._send_messages([msg], set_and_apply=False)
+        # Initialization is always sent and resets what the firmware shows
+        self._last_frame = None
+        success = self._send_messages([self._msg_initialize], set_and_apply=False)
+        self._last_frame = None
+        return success
     
     def single_static(self, color: Color) -> bool:
-        msg = self._create_message()
+        msg = self._tpl_static
         msg[4] = color.red
         msg[5] = color.green
         msg[6] = color.blue
         return self._send_messages([msg])
     
     def single_breathing(self, color1: Color, color2: Color, speed: Speed) -> bool:
-        msg = self._create_message()
-        msg[3] = 1
+        msg = self._tpl_breathing
         msg[4] = color1.red
         msg[5] = color1.green
         msg[6] = color1.blue
         msg[7] = speed.byte_value
-        msg[9] = 1
         msg[10] = color2.red
         msg[11] = color2.green
         msg[12] = color2.blue
         return self._send_messages([msg])
     
     def single_colorcycle(self, speed: Speed) -> bool:
-        msg = self._create_message()
-        msg[3] = 2
-        msg[4] = 0xff
+        msg = self._tpl_colorcycle
         msg[7] = speed.byte_value
         return self._send_messages([msg])
     
+    def _pad_zones(self, colors: List[Color]) -> List[Color]:
+        if len(colors) >= 4:
+            return colors[:4]
+        return list(colors) + [Color._unchecked(255, 255, 255)] * (4 - len(colors))
+    
     def multi_static(self, colors: List[Color]) -> bool:
-        if len(colors) > 4:
-            colors = colors[:4]
-        elif len(colors) < 4:
-            colors.extend([Color(255, 255, 255)] * (4 - len(colors)))
-        
-        messages = []
-        for i, color in enumerate(colors):
-            msg = self._create_message()
-            msg[2] = i + 1
+        messages = self._tpl_multi_static
+        for msg, color in zip(messages, self._pad_zones(colors)):
             msg[4] = color.red
             msg[5] = color.green
             msg[6] = color.blue
-            msg[7] = 0xeb
-            messages.append(msg)
         
         return self._send_messages(messages)
     
     def multi_breathing(self, colors: List[Color], speed: Speed) -> bool:
-        if len(colors) > 4:
-            colors = colors[:4]
-        elif len(colors) < 4:
-            colors.extend([Color(255, 255, 255)] * (4 - len(colors)))
-        
-        messages = []
-        for i, color in enumerate(colors):
-            msg = self._create_message()
-            msg[2] = i + 1
-            msg[3] = 1
+        messages = self._tpl_multi_breathing
+        speed_byte = speed.byte_value
+        for msg, color in zip(messages, self._pad_zones(colors)):
             msg[4] = color.red
             msg[5] = color.green
             msg[6] = color.blue
-            msg[7] = speed.byte_value
-            messages.append(msg)
+            msg[7] = speed_byte
         
         return self._send_messages(messages)
     
     def rainbow_cycle(self, speed: Speed) -> bool:
-        msg = self._create_message()
-        msg[3] = 3
-        msg[4] = 0xff
+        msg = self._tpl_rainbow_cycle
         msg[7] = speed.byte_value
         return self._send_messages([msg])
     
     def rainbow(self) -> bool:
         colors = [
-            Color(255, 0, 0),
-            Color(255, 255, 0),
-            Color(0, 255, 255),
-            Color(255, 0, 255),
+            Color._unchecked(255, 0, 0),
+            Color._unchecked(255, 255, 0),
+            Color._unchecked(0, 255, 255),
+            Color._unchecked(255, 0, 255),
         ]
         return self.multi_static(colors)
     
@@ -275,19 +332,41 @@ class RogAuraUSB:
 
 class RogAuraNative:
     
+    # Every public method other than these talks to the device
+    _CONNECTION_METHODS = frozenset({'connect', 'disconnect'})
+    
     def __init__(self):
         self.usb = RogAuraUSB()
         self.logger = logging.getLogger(__name__)
         self.connected = False
+        self._bind_device_methods()
+    
+    @staticmethod
+    def _disconnected(*args, **kwargs) -> bool:
+        return False
+    
+    def _bind_device_methods(self):
+        if self.connected:
+            for name in self._DEVICE_METHODS:
+                self.__dict__.pop(name, None)
+        else:
+            for name in self._DEVICE_METHODS:
+                setattr(self, name, self._disconnected)
     
     def connect(self) -> bool:
         self.connected = self.usb.connect()
+        self._bind_device_methods()
         return self.connected
     
+    @property
+    def transfer_failed(self) -> bool:
+        return self.usb.transfer_failed
+    
     def disconnect(self):
         if self.connected:
             self.usb.disconnect()
             self.connected = False
+            self._bind_device_methods()
     
     def __enter__(self):
         self.connect()
@@ -297,28 +376,18 @@ class RogAuraNative:
         self.disconnect()
     
     def set_brightness(self, brightness: int) -> bool:
-        if not self.connected:
-            return False
         return self.usb.set_brightness(brightness)
     
     def initialize_keyboard(self) -> bool:
-        if not self.connected:
-            return False
         return self.usb.initialize_keyboard()
     
     def apply_color(self, color_name: str) -> bool:
-        if not self.connected:
-            return False
         return self.usb.apply_color(color_name)
     
     def apply_custom_color(self, hex_color: str) -> bool:
-        if not self.connected:
-            return False
         return self.usb.apply_custom_color(hex_color)
     
     def single_breathing(self, color1_hex: str = "ffffff", color2_hex: str = "ff0000", speed: int = 2) -> bool:
-        if not self.connected:
-            return False
         try:
             color1 = Color.from_hex(color1_hex)
             color2 = Color.from_hex(color2_hex)
@@ -328,8 +397,6 @@ class RogAuraNative:
             return False
     
     def single_colorcycle(self, speed: int = 2) -> bool:
-        if not self.connected:
-            return False
         try:
             speed_enum = Speed(speed)
             return self.usb.single_colorcycle(speed_enum)
@@ -337,9 +404,6 @@ class RogAuraNative:
             return False
     
     def multi_static(self, colors: List[str] = None) -> bool:
-        if not self.connected:
-            return False
-        
         if colors is None:
             colors = ["ff0000", "00ff00", "0000ff", "ffff00"]
         
@@ -350,9 +414,6 @@ class RogAuraNative:
             return False
     
     def multi_breathing(self, colors: List[str] = None, speed: int = 2) -> bool:
-        if not self.connected:
-            return False
-        
         if colors is None:
             colors = ["ff0000", "00ff00", "0000ff", "ffff00"]
         
@@ -364,13 +425,9 @@ class RogAuraNative:
             return False
     
     def rainbow(self) -> bool:
-        if not self.connected:
-            return False
         return self.usb.rainbow()
     
     def rainbow_cycle(self, speed: int = 2) -> bool:
-        if not self.connected:
-            return False
         try:
             speed_enum = Speed(speed)
             return self.usb.rainbow_cycle(speed_enum)
@@ -378,10 +435,18 @@ class RogAuraNative:
             return False
     
     def single_static(self, color_hex: str) -> bool:
-        if not self.connected:
-            return False
         try:
             color = Color.from_hex(color_hex)
             return self.usb.single_static(color)
         except ValueError:
-            return False
\ No newline at end of file
+            return False
+
+
+# Shadowed per instance by _disconnected while there is no device, so the
+# methods themselves never check self.connected. Derived from the class so a
+# newly added device method cannot be left out.
+RogAuraNative._DEVICE_METHODS = tuple(
+    name for name, attr in vars(RogAuraNative).items()
+    if callable(attr) and not name.startswith('_')
+    and name not in RogAuraNative._CONNECTION_METHODS
+)
@@ -1,22 +1,44 @@
+import functools
+import math
+from collections import deque
+
 from PyQt6.QtWidgets import (
     QWidget, QPushButton, QLabel, QLineEdit, QHBoxLayout, QVBoxLayout,
     QTextEdit, QProgressBar, QComboBox, QSlider, QColorDialog
 )
 from PyQt6.QtCore import (
-    Qt, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve, QRegularExpression
+    Qt, pyqtSignal, pyqtSlot, QTimer, QPropertyAnimation, QEasingCurve, QRegularExpression,
+    QThreadPool
 )
 from PyQt6.QtGui import (
-    QColor, QRegularExpressionValidator, QPainter, QLinearGradient, QFont, QPalette
+    QColor, QRegularExpressionValidator, QPainter, QLinearGradient, QFont, QPalette,
+    QTextCursor, QPixmap
 )
 
 
+# radians in (-pi, pi] shifted to [0, 2pi) -> degrees of hue
+_HUE_SCALE = 360.0 / (2.0 * math.pi)
+
+
+# Bounded, since the hex field can hand over any partial text the user typed
+@functools.lru_cache(maxsize=32)
+def _qcolor(hexc: str) -> QColor:
+    return QColor(hexc)
+
+
 class CompactColorPicker(QWidget):
     color_selected = pyqtSignal(str)
+    
+    RECENT_COUNT = 6
+    
+    # Implicitly shared, so every validator reuses the one compiled pattern
+    _HEX_RX = QRegularExpression("^#?[0-9A-Fa-f]{6}$")
 
     def __init__(self, accent="#6EB6FF"):
         super().__init__()
         self._accent = accent
-        self._recent: list[str] = []
+        self._recent: deque[str] = deque(maxlen=self.RECENT_COUNT)
+        self._current = None
         self._build_ui()
 
     def _build_ui(self):
@@ -29,6 +51,16 @@ class CompactColorPicker(QWidget):
         recent_row.addWidget(self._make_section_label("Recent"))
         self.recent_wrap = QHBoxLayout()
         self.recent_wrap.setSpacing(6)
+        self._swatches = []
+        for _ in range(self.RECENT_COUNT):
+            b = QPushButton()
+            b.setObjectName("swatch")
+            b.setFixedSize(32, 22)
+            b.setProperty("hex", "")
+            b.setVisible(False)
+            b.clicked.connect(self._on_swatch_clicked)
+            self.recent_wrap.addWidget(b)
+            self._swatches.append(b)
         recent_row.addLayout(self.recent_wrap)
         recent_row.addStretch()
         root.addLayout(recent_row)
@@ -45,8 +77,7 @@ class CompactColorPicker(QWidget):
         self.hex_edit.setObjectName("hexField")
         self.hex_edit.setPlaceholderText("#RRGGBB")
         self.hex_edit.setFixedWidth(110)
-        rx = QRegularExpression("^#?[0-9A-Fa-f]{6}$")
-        self.hex_edit.setValidator(QRegularExpressionValidator(rx))
+        self.hex_edit.setValidator(QRegularExpressionValidator(self._HEX_RX, self.hex_edit))
         self.hex_edit.returnPressed.connect(self._apply_hex_from_field)
 
         self.pick_btn = QPushButton("Pick…")
@@ -61,6 +92,8 @@ class CompactColorPicker(QWidget):
         root.addLayout(bar)
 
         self._select_color("#FFFFFF")
+        # The initial white is only a display default, picking it is still a change
+        self._current = None
 
     def _make_section_label(self, text):
         lab = QLabel(text)
@@ -72,7 +105,7 @@ class CompactColorPicker(QWidget):
         dlg = QColorDialog(self)
         dlg.setOption(QColorDialog.ColorDialogOption.DontUseNativeDialog, True)
         cur = self.hex_edit.text() or "#FFFFFF"
-        dlg.setCurrentColor(QColor(cur if cur.startswith("#") else f"#{cur}"))
+        dlg.setCurrentColor(_qcolor(cur if cur.startswith("#") else f"#{cur}"))
         if dlg.exec():
             self._select_color(dlg.currentColor().name().upper())
 
@@ -88,33 +121,38 @@ class CompactColorPicker(QWidget):
         if not hexc.startswith("#"):
             hexc = "#" + hexc
         hexc = hexc.upper()
+        if hexc == self._current:
+            return
+        self._current = hexc
 
         self.preview.setStyleSheet(f"background:{hexc}; border-radius:4px;")
         self.hex_edit.setText(hexc)
 
-        if hexc in self._recent:
+        try:
             self._recent.remove(hexc)
-        self._recent.insert(0, hexc)
-        self._recent = self._recent[:6]
+        except ValueError:
+            pass
+        self._recent.appendleft(hexc)
         self._rebuild_recent()
 
         self.color_selected.emit(hexc[1:])
 
     def _rebuild_recent(self):
-        while self.recent_wrap.count():
-            item = self.recent_wrap.takeAt(0)
-            w = item.widget()
-            if w:
-                w.setParent(None)
+        for b, hexc in zip(self._swatches, self._recent):
+            if b.property("hex") != hexc:
+                b.setProperty("hex", hexc)
+                b.setToolTip(hexc)
+                b.setStyleSheet(f"background:{hexc};")
+            b.setVisible(True)
 
-        for hexc in self._recent:
-            b = QPushButton()
-            b.setObjectName("swatch")
-            b.setFixedSize(32, 22)
-            b.setToolTip(hexc)
-            b.setStyleSheet(f"background:{hexc};")
-            b.clicked.connect(lambda checked=False, c=hexc: self._select_color(c))
-            self.recent_wrap.addWidget(b)
+        for b in self._swatches[len(self._recent):]:
+            b.setVisible(False)
+
+    @pyqtSlot()
+    def _on_swatch_clicked(self):
+        hexc = self.sender().property("hex")
+        if hexc:
+            self._select_color(hexc)
 
 class ColorPicker(QWidget):    
     color_selected = pyqtSignal(str)
@@ -145,6 +183,10 @@ class EffectSelector(QWidget):
     
     def __init__(self):
         super().__init__()
+        self._coalesce = QTimer(self)
+        self._coalesce.setSingleShot(True)
+        self._coalesce.setInterval(30)
+        self._coalesce.timeout.connect(self._emit_effect)
         self.init_ui()
         
     def init_ui(self):
@@ -182,6 +224,9 @@ class EffectSelector(QWidget):
         layout.addLayout(speed_layout)
         
     def on_effect_changed(self):
+        self._coalesce.start()
+        
+    def _emit_effect(self):
         effect = self.effect_combo.currentText()
         params = {
             'speed': self.speed_slider.value()
@@ -190,8 +235,13 @@ class EffectSelector(QWidget):
 
 
 class StatusBar(QWidget):
+    _CSS_INFO = "color: #4CAF50;"
+    _CSS_ERROR = "color: #F44336;"
+    _CSS_WARN = "color: #FF9800;"
+    
     def __init__(self):
         super().__init__()
+        self._css = ""
         self.message_timer = QTimer()
         self.message_timer.timeout.connect(self.clear_message)
         self.init_ui()
@@ -213,20 +263,25 @@ class StatusBar(QWidget):
         
     def show_message(self, message: str, timeout: int = 3000):
         self.status_label.setText(message)
-        self.status_label.setStyleSheet("color: #4CAF50;")
+        self._set_css(self._CSS_INFO)
         self.message_timer.start(timeout)
         
     def show_error(self, message: str, timeout: int = 5000):
         self.status_label.setText(f"Error: {message}")
-        self.status_label.setText(f"Error: {message}")
-        self.status_label.setStyleSheet("color: #F44336;")
+        self._set_css(self._CSS_ERROR)
         self.message_timer.start(timeout)
         
     def show_warning(self, message: str, timeout: int = 4000):
         self.status_label.setText(f"Warning: {message}")
-        self.status_label.setStyleSheet("color: #FF9800;")
+        self._set_css(self._CSS_WARN)
         self.message_timer.start(timeout)
         
+    def _set_css(self, css: str):
+        # setStyleSheet re-polishes the label even when the sheet is identical
+        if css != self._css:
+            self._css = css
+            self.status_label.setStyleSheet(css)
+        
     def show_progress(self, show: bool = True):
         self.progress_bar.setVisible(show)
         
@@ -235,7 +290,7 @@ class StatusBar(QWidget):
         
     def clear_message(self):
         self.status_label.setText("Ready")
-        self.status_label.setStyleSheet("")
+        self._set_css("")
         self.message_timer.stop()
 
 
@@ -264,9 +319,30 @@ class ColorWheel(QWidget):
         super().__init__()
         self.setMinimumSize(200, 200)
         self.selected_color = QColor(255, 255, 255)
+        self._cache = None
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(16)
+        self._emit_timer.timeout.connect(self._emit_color)
         
     def paintEvent(self, event):
-        painter = QPainter(self)
+        # The pixmap carries the DPR it was rendered at; moving to a screen
+        # with a different scale needs a fresh one
+        if self._cache is None or self._cache.devicePixelRatio() != self.devicePixelRatioF():
+            self._cache = self._render_wheel()
+        QPainter(self).drawPixmap(0, 0, self._cache)
+        
+    def resizeEvent(self, event):
+        self._cache = None
+        super().resizeEvent(event)
+        
+    def _render_wheel(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         center = self.rect().center()
@@ -284,26 +360,44 @@ class ColorWheel(QWidget):
         painter.setBrush(gradient)
         painter.drawEllipse(center.x() - radius, center.y() - radius, 
                           radius * 2, radius * 2)
+        painter.end()
+        return pixmap
                           
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            center = self.rect().center()
-            dx = event.position().x() - center.x()
-            dy = event.position().y() - center.y()
+            self._pick_color(event)
             
-            import math
-            angle = math.atan2(dy, dx)
-            hue = int((angle + math.pi) / (2 * math.pi) * 360)
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.MouseButton.LeftButton:
+            self._pick_color(event)
             
-            self.selected_color = QColor.fromHsv(hue, 255, 255)
-            self.color_changed.emit(self.selected_color)
-            self.update()
+    def _pick_color(self, event):
+        center = self.rect().center()
+        dx = event.position().x() - center.x()
+        dy = event.position().y() - center.y()
+        
+        hue = int((math.atan2(dy, dx) + math.pi) * _HUE_SCALE) % 360
+        
+        self.selected_color = QColor.fromHsv(hue, 255, 255)
+        self.update()
+        # Scrubbing the wheel emits at most once per frame
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+            
+    def _emit_color(self):
+        self.color_changed.emit(self.selected_color)
 
 
 class LogViewer(QWidget):
+    # Emitted from the export worker thread, delivered queued to add_log
+    _export_done = pyqtSignal(str, str)
+    
+    EXPORT_CHUNK_SIZE = 64 * 1024
     
     def __init__(self):
         super().__init__()
+        self._pending = deque()
+        self._export_done.connect(self.add_log)
         self.init_ui()
         
     def init_ui(self):
@@ -330,16 +424,37 @@ class LogViewer(QWidget):
         layout.addWidget(self.log_text)
         layout.addLayout(button_layout)
         
+        # Bursts of log lines are laid out and scrolled once per ~30 Hz tick
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(33)
+        self._flush_timer.timeout.connect(self._flush)
+        
     def add_log(self, message: str, level: str = "INFO"):
         from datetime import datetime
         timestamp = datetime.now().strftime("%H:%M:%S")
         formatted_message = f"[{timestamp}] {level}: {message}"
-        self.log_text.append(formatted_message)
+        self._pending.append(formatted_message)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+        
+    def _flush(self):
+        if not self._pending:
+            return
+        text = "\n".join(self._pending)
+        self._pending.clear()
+        
+        cursor = self.log_text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.log_text.document().isEmpty():
+            text = "\n" + text
+        cursor.insertText(text)
         
         scrollbar = self.log_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
         
     def clear_logs(self):
+        self._pending.clear()
         self.log_text.clear()
         
     def export_logs(self):
@@ -352,9 +467,15 @@ class LogViewer(QWidget):
         )
         
         if file_path:
-            try:
-                with open(file_path, 'w') as f:
-                    f.write(self.log_text.toPlainText())
-                self.add_log(f"Logs exported to {file_path}")
-            except Exception as e:
-                self.add_log(f"Failed to export logs: {str(e)}", "ERROR")
\ No newline at end of file
+            self._flush()
+            text = self.log_text.toPlainText()
+            QThreadPool.globalInstance().start(lambda: self._write_chunks(file_path, text))
+            
+    def _write_chunks(self, file_path: str, text: str):
+        try:
+            with open(file_path, 'w') as f:
+                for i in range(0, len(text), self.EXPORT_CHUNK_SIZE):
+                    f.write(text[i:i + self.EXPORT_CHUNK_SIZE])
+            self._export_done.emit(f"Logs exported to {file_path}", "INFO")
+        except Exception as e:
+            self._export_done.emit(f"Failed to export logs: {str(e)}", "ERROR")
\ No newline at end of file